@@ -1,4 +1,5 @@
 """Storage module for Azure Blob Storage operations."""
-from .blob_storage import AzureBlobStorage
+from .blob_storage import AzureBlobStorage, close_all
+from .async_blob_storage import AsyncAzureBlobStorage
 
-__all__ = ['AzureBlobStorage']
+__all__ = ['AzureBlobStorage', 'AsyncAzureBlobStorage', 'close_all']
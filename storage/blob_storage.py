@@ -1,10 +1,141 @@
 """
 Azure Blob Storage client for handling blob operations.
 """
+import codecs
+import gzip
+import hashlib
+import io
 import os
-from typing import Optional, Union
-from azure.storage.blob import BlobServiceClient, BlobClient, ContainerClient
-from azure.core.exceptions import ResourceNotFoundError, ResourceExistsError
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from requests import Session
+from requests.adapters import HTTPAdapter
+from azure.storage.blob import BlobServiceClient, BlobClient, ContainerClient, ContentSettings
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceNotFoundError, ResourceExistsError, ResourceModifiedError
+from azure.core.pipeline.transport import RequestsTransport
+
+# Size the HTTP connection pool to the highest max_concurrency we expect,
+# so parallel range requests reuse warm keep-alive connections instead of
+# discarding them and renegotiating TLS (urllib3 defaults to a pool of 10).
+_POOL_SIZE = 64
+
+# Strings up to this size are encoded in one shot; larger ones are
+# streamed through an incremental encoder so the encoded copy never
+# exists in full alongside the original.
+_ENCODE_CHUNK_SIZE = 1 << 20
+
+
+# Payload types upload_blob accepts. bytes, open binary files, and
+# iterables of byte chunks stream to the SDK as-is; bytearray and
+# memoryview are normalized to bytes first (one copy) since the SDK's
+# uploader only handles bytes directly.
+BlobData = Union[str, bytes, bytearray, memoryview, IO[bytes], Iterable[bytes]]
+
+
+def _encode_chunks(text: str, encoding: str = 'utf-8') -> Iterator[bytes]:
+    """Yield the encoded form of a string one chunk at a time."""
+    encoder = codecs.getincrementalencoder(encoding)()
+    for i in range(0, len(text), _ENCODE_CHUNK_SIZE):
+        yield encoder.encode(text[i:i + _ENCODE_CHUNK_SIZE])
+    yield encoder.encode('', final=True)
+
+
+def _iter_chunks(data: Union[IO[bytes], Iterable[bytes]]) -> Iterator[bytes]:
+    """Yield byte chunks from a binary file or an iterable of chunks."""
+    if hasattr(data, 'read'):
+        while True:
+            chunk = data.read(_ENCODE_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from data
+
+
+def _gzip_chunks(data: Union[IO[bytes], Iterable[bytes]]) -> Iterator[bytes]:
+    """Gzip-compress a stream of byte chunks incrementally."""
+    # wbits=31 selects the gzip container, matching gzip.compress().
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in _iter_chunks(data):
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _gunzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress a stream of gzip-compressed byte chunks incrementally."""
+    decompressor = zlib.decompressobj(wbits=31)
+    for chunk in chunks:
+        decompressed = decompressor.decompress(chunk)
+        if decompressed:
+            yield decompressed
+    yield decompressor.flush()
+
+
+# Live service clients keyed by connection string. A plain dict rather
+# than an lru_cache: close() can evict a single entry, and nothing is
+# ever dropped from the cache while its connections are still open.
+_CLIENTS: Dict[str, Tuple[BlobServiceClient, Session]] = {}
+
+
+def _make_client(connection_string: str) -> Tuple[BlobServiceClient, Session]:
+    """Build (and cache) a service client for a connection string.
+
+    Parsing the connection string and assembling the policy pipeline is
+    repeated work when scripts construct an AzureBlobStorage per
+    request; caching here means wrapper instances with the same
+    connection string share one client and one connection pool.
+    """
+    try:
+        return _CLIENTS[connection_string]
+    except KeyError:
+        pass
+
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+    session.mount('https://', adapter)
+    transport = RequestsTransport(session=session, session_owner=False)
+
+    # Larger single-shot and chunked transfer sizes amortize the
+    # per-request round trip and handshake cost on big blobs.
+    client = BlobServiceClient.from_connection_string(
+        connection_string,
+        transport=transport,
+        max_single_get_size=64 * 1024 * 1024,
+        max_chunk_get_size=16 * 1024 * 1024,
+        # Bound tail latency: fail fast on dead sockets instead of
+        # hanging for the SDK's default 100 s, and retry transient
+        # faults with exponential backoff.
+        retry_total=5,
+        retry_connect=3,
+        retry_read=3,
+        retry_status=3,
+        connection_timeout=20,
+        read_timeout=60,
+        retry_to_secondary=False
+    )
+    _CLIENTS[connection_string] = (client, session)
+    return client, session
+
+
+def _close_client(connection_string: str) -> None:
+    """Close and evict the cached client for one connection string."""
+    entry = _CLIENTS.pop(connection_string, None)
+    if entry is not None:
+        client, session = entry
+        client.close()
+        session.close()
+
+
+def close_all() -> None:
+    """Close every cached service client and its connection pool."""
+    for connection_string in list(_CLIENTS):
+        _close_client(connection_string)
 
 
 class AzureBlobStorage:
@@ -22,7 +153,30 @@ class AzureBlobStorage:
         if not self.connection_string:
             raise ValueError("Azure Storage connection string is required")
 
-        self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
+        self.blob_service_client, self._session = _make_client(self.connection_string)
+
+        # Per-instance caches: building a client re-parses the account URL
+        # and re-assembles the policy pipeline, which adds up on workloads
+        # that touch thousands of small blobs. Caching on the instance
+        # (rather than decorating the methods) avoids pinning self in a
+        # class-level lru_cache.
+        self._get_blob_client = lru_cache(maxsize=4096)(
+            self.blob_service_client.get_blob_client
+        )
+        self._get_container_client = lru_cache(maxsize=256)(
+            self.blob_service_client.get_container_client
+        )
+
+    def close(self) -> None:
+        """Close the underlying client and its pooled connections.
+
+        The client is shared between wrapper instances built from the
+        same connection string, so this closes it for all of them and
+        evicts it from the cache — a later instantiation builds a fresh
+        client rather than receiving a closed one. Use close_all() to
+        release every cached client at process shutdown.
+        """
+        _close_client(self.connection_string)
 
     def create_container(self, container_name: str) -> ContainerClient:
         """
@@ -42,46 +196,209 @@ class AzureBlobStorage:
             return container_client
         except ResourceExistsError:
             # Container already exists, return the existing one
-            return self.blob_service_client.get_container_client(container_name)
+            return self._get_container_client(container_name)
 
     def upload_blob(
         self,
         container_name: str,
         blob_name: str,
-        data: Union[bytes, str],
-        overwrite: bool = True
-    ) -> BlobClient:
+        data: BlobData,
+        overwrite: bool = True,
+        if_missing: bool = False,
+        compress: bool = False,
+        max_concurrency: int = 4
+    ) -> Optional[BlobClient]:
         """
         Upload a blob to a container.
 
+        bytes payloads, open binary files, and iterables of byte chunks
+        are handed to the SDK without copying — for large blobs, prefer
+        an open file handle so the uploader streams straight from it
+        instead of going through an in-heap copy. bytearray and
+        memoryview are accepted but normalized to bytes first.
+
         Args:
             container_name: Name of the container.
             blob_name: Name of the blob.
-            data: Data to upload (bytes or string).
+            data: Data to upload (string, bytes-like object, binary
+                  file, or iterable of bytes chunks).
             overwrite: Whether to overwrite if blob exists.
+            if_missing: Upload only if the blob doesn't exist yet,
+                        enforced via an If-None-Match precondition on
+                        the PUT itself — no separate existence probe.
+            compress: Gzip the payload and store it with
+                      Content-Encoding: gzip. Worthwhile for text/JSON/
+                      log blobs, which typically shrink 3-10x, cutting
+                      transfer time on upload and every later download;
+                      get_blob_as_text decompresses transparently.
+            max_concurrency: Maximum number of parallel connections used
+                             for chunked uploads of large blobs.
 
         Returns:
-            BlobClient for the uploaded blob.
+            BlobClient for the uploaded blob, or None if if_missing was
+            set and the blob already existed. The returned client lets
+            callers chain follow-up operations (properties, download,
+            tags) without another get_blob_client lookup.
         """
-        blob_client = self.blob_service_client.get_blob_client(
-            container=container_name,
-            blob=blob_name
-        )
+        blob_client = self._get_blob_client(container=container_name, blob=blob_name)
 
-        # Convert string to bytes if needed
+        # Convert string to bytes if needed; large strings are encoded
+        # chunkwise so peak memory is the original plus one chunk rather
+        # than a second full-size encoded copy.
         if isinstance(data, str):
-            data = data.encode('utf-8')
+            if len(data) <= _ENCODE_CHUNK_SIZE:
+                data = data.encode('utf-8')
+            else:
+                data = _encode_chunks(data)
+        elif isinstance(data, (bytearray, memoryview)):
+            # The SDK only special-cases bytes; bytearray/memoryview fall
+            # into its iterable branch and iterate as ints. Normalizing
+            # costs one copy but is the only shape the uploader accepts.
+            data = bytes(data)
+        elif isinstance(data, (bytes, io.IOBase)) or hasattr(data, '__iter__'):
+            # Already streamable; pass through untouched to keep the
+            # zero-copy path down to the socket.
+            pass
+        else:
+            raise TypeError(f"Unsupported blob data type: {type(data).__name__}")
+
+        if compress:
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                data = gzip.compress(bytes(data))
+            else:
+                data = _gzip_chunks(data)
+
+        # Send a client-computed Content-MD5 so the service verifies the
+        # payload inside the same PUT and rejects transport corruption
+        # immediately. MD5 over in-memory bytes is cheap next to the
+        # network time; streamed payloads skip it since the header must
+        # precede the body.
+        content_md5 = None
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            content_md5 = bytearray(hashlib.md5(data).digest())
+
+        content_settings = None
+        if content_md5 is not None or compress:
+            content_settings = ContentSettings(
+                content_md5=content_md5,
+                content_encoding='gzip' if compress else None
+            )
 
-        blob_client.upload_blob(data, overwrite=overwrite)
+        if if_missing:
+            try:
+                blob_client.upload_blob(
+                    data,
+                    overwrite=False,
+                    match_condition=MatchConditions.IfMissing,
+                    content_settings=content_settings,
+                    max_concurrency=max_concurrency
+                )
+            except (ResourceExistsError, ResourceModifiedError):
+                return None
+            return blob_client
+
+        blob_client.upload_blob(
+            data,
+            overwrite=overwrite,
+            content_settings=content_settings,
+            max_concurrency=max_concurrency
+        )
         return blob_client
 
-    def download_blob(self, container_name: str, blob_name: str) -> bytes:
+    def upload_many(
+        self,
+        container_name: str,
+        items: Iterable[Tuple[str, BlobData]],
+        max_workers: int = 8
+    ) -> List[BlobClient]:
+        """
+        Upload multiple blobs in parallel.
+
+        Each upload is an independent, I/O-bound request, so fanning
+        them out over a thread pool turns N sequential round trips into
+        roughly one. The shared service client is thread-safe.
+
+        Args:
+            container_name: Name of the container.
+            items: (blob_name, data) pairs to upload.
+            max_workers: Maximum number of concurrent uploads.
+
+        Returns:
+            List of BlobClients for the uploaded blobs, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.upload_blob, container_name, name, data)
+                for name, data in items
+            ]
+            return [future.result() for future in futures]
+
+    def put_object(
+        self,
+        container_name: str,
+        blob_name: str,
+        data: BlobData,
+        overwrite: bool = True
+    ) -> BlobClient:
+        """
+        Upload a blob, creating the container only if it's missing.
+
+        Unlike create_container() + upload_blob(), this attempts the
+        upload straight away and only pays the container-creation round
+        trip when the service reports the container doesn't exist — on
+        the common path (existing container) that's one request instead
+        of two.
+
+        Because the upload may be retried after creating the container,
+        the payload must be replayable: strings, bytes-like objects, or
+        seekable binary files. One-shot iterators are rejected — a
+        failed first attempt would consume them and the retry would
+        silently upload a truncated blob.
+
+        Args:
+            container_name: Name of the container.
+            blob_name: Name of the blob.
+            data: Data to upload (string, bytes-like object, or
+                  seekable binary file).
+            overwrite: Whether to overwrite if blob exists.
+
+        Returns:
+            BlobClient for the uploaded blob.
+
+        Raises:
+            TypeError: If data is not replayable (e.g. a generator or
+                       non-seekable stream).
+        """
+        rewind = None
+        if not isinstance(data, (str, bytes, bytearray, memoryview)):
+            if hasattr(data, 'read') and getattr(data, 'seekable', lambda: False)():
+                start = data.tell()
+                rewind = lambda: data.seek(start)
+            else:
+                raise TypeError(
+                    "put_object requires a replayable payload (str, bytes-like object, "
+                    "or seekable binary file); use create_container() + upload_blob() "
+                    "for one-shot iterators"
+                )
+
+        try:
+            return self.upload_blob(container_name, blob_name, data, overwrite=overwrite)
+        except ResourceNotFoundError:
+            # Container missing: create it and retry the upload once.
+            self.create_container(container_name)
+            if rewind is not None:
+                rewind()
+            return self.upload_blob(container_name, blob_name, data, overwrite=overwrite)
+
+    def download_blob(self, container_name: str, blob_name: str, max_concurrency: int = 4) -> bytes:
         """
         Download a blob from a container.
 
         Args:
             container_name: Name of the container.
             blob_name: Name of the blob.
+            max_concurrency: Maximum number of parallel connections used
+                             for chunked downloads of large blobs.
 
         Returns:
             Blob data as bytes.
@@ -89,18 +406,80 @@ class AzureBlobStorage:
         Raises:
             ResourceNotFoundError: If blob doesn't exist.
         """
-        blob_client = self.blob_service_client.get_blob_client(
-            container=container_name,
-            blob=blob_name
-        )
+        blob_client = self._get_blob_client(container=container_name, blob=blob_name)
 
-        download_stream = blob_client.download_blob()
+        # decompress=False: return the stored bytes verbatim. Letting the
+        # transport gunzip Content-Encoding: gzip blobs would corrupt
+        # multi-range downloads (each 206 range decoded independently)
+        # and make raw reads silently differ from what was uploaded.
+        download_stream = blob_client.download_blob(max_concurrency=max_concurrency, decompress=False)
         return download_stream.readall()
 
+    def stream_blob(self, container_name: str, blob_name: str) -> Iterator[bytes]:
+        """
+        Download a blob as an iterator of chunks.
+
+        Unlike download_blob, this never buffers the whole blob in memory:
+        chunks are yielded as they arrive, so peak memory stays at one
+        chunk regardless of blob size and callers can start consuming
+        after the first chunk instead of waiting for the last byte.
+        Consume the iterator fully (or abandon it promptly): a
+        half-consumed stream keeps its connection checked out of the
+        pool until the read timeout expires.
+
+        Args:
+            container_name: Name of the container.
+            blob_name: Name of the blob.
+
+        Returns:
+            Iterator over the blob's content as bytes chunks.
+
+        Raises:
+            ResourceNotFoundError: If blob doesn't exist.
+        """
+        blob_client = self._get_blob_client(container=container_name, blob=blob_name)
+        return blob_client.download_blob(decompress=False).chunks()
+
+    def download_blob_to_file(
+        self,
+        container_name: str,
+        blob_name: str,
+        path: str,
+        max_concurrency: int = 4
+    ) -> None:
+        """
+        Download a blob directly into a local file.
+
+        The SDK writes its parallel range downloads straight into the
+        open file, skipping the intermediate bytes object that
+        download_blob would materialize.
+
+        Args:
+            container_name: Name of the container.
+            blob_name: Name of the blob.
+            path: Local file path to write the blob to.
+            max_concurrency: Maximum number of parallel connections used
+                             for chunked downloads of large blobs.
+
+        Raises:
+            ResourceNotFoundError: If blob doesn't exist.
+        """
+        blob_client = self._get_blob_client(container=container_name, blob=blob_name)
+        with open(path, 'wb') as file_handle:
+            blob_client.download_blob(
+                max_concurrency=max_concurrency,
+                decompress=False
+            ).readinto(file_handle)
+
     def get_blob_as_text(self, container_name: str, blob_name: str, encoding: str = 'utf-8') -> str:
         """
         Download a blob and return as text.
 
+        Decodes chunk by chunk with an incremental decoder, so only the
+        decoded text plus one chunk of raw bytes is ever resident.
+        Blobs stored with Content-Encoding: gzip (see upload_blob's
+        compress flag) are decompressed transparently.
+
         Args:
             container_name: Name of the container.
             blob_name: Name of the blob.
@@ -109,13 +488,49 @@ class AzureBlobStorage:
         Returns:
             Blob data as string.
         """
-        data = self.download_blob(container_name, blob_name)
-        return data.decode(encoding)
+        # decompress=False keeps the transport from gunzipping the
+        # response itself; we decompress here, once, based on the blob's
+        # stored content encoding.
+        blob_client = self._get_blob_client(container=container_name, blob=blob_name)
+        downloader = blob_client.download_blob(decompress=False)
+        chunks = downloader.chunks()
+        if downloader.properties.content_settings.content_encoding == 'gzip':
+            chunks = _gunzip_chunks(chunks)
+
+        decoder = codecs.getincrementaldecoder(encoding)()
+        parts = [decoder.decode(chunk) for chunk in chunks]
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+
+    def try_download(self, container_name: str, blob_name: str) -> Optional[bytes]:
+        """
+        Download a blob, returning None if it doesn't exist.
+
+        Prefer this over blob_exists() + download_blob() for
+        check-then-read patterns: probing existence first costs a full
+        extra round trip only to ask a question the GET answers anyway.
+
+        Args:
+            container_name: Name of the container.
+            blob_name: Name of the blob.
+
+        Returns:
+            Blob data as bytes, or None if the blob doesn't exist.
+        """
+        try:
+            return self.download_blob(container_name, blob_name)
+        except ResourceNotFoundError:
+            return None
 
     def blob_exists(self, container_name: str, blob_name: str) -> bool:
         """
         Check if a blob exists.
 
+        Note: this issues a GetBlobProperties request, a full round trip
+        of its own. If the blob is about to be read anyway, use
+        try_download() and treat None as "missing" instead of paying for
+        a separate existence probe.
+
         Args:
             container_name: Name of the container.
             blob_name: Name of the blob.
@@ -124,10 +539,7 @@ class AzureBlobStorage:
             True if blob exists, False otherwise.
         """
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=container_name,
-                blob=blob_name
-            )
+            blob_client = self._get_blob_client(container=container_name, blob=blob_name)
             blob_client.get_blob_properties()
             return True
         except ResourceNotFoundError:
@@ -141,12 +553,29 @@ class AzureBlobStorage:
             container_name: Name of the container.
             blob_name: Name of the blob.
         """
-        blob_client = self.blob_service_client.get_blob_client(
-            container=container_name,
-            blob=blob_name
-        )
+        blob_client = self._get_blob_client(container=container_name, blob=blob_name)
         blob_client.delete_blob()
 
+    def delete_blobs(self, container_name: str, blob_names: Iterable[str]) -> None:
+        """
+        Delete multiple blobs using the Storage Batch API.
+
+        The service accepts up to 256 deletes per batch request, so N
+        deletes cost ceil(N/256) round trips instead of N. Blobs that
+        don't exist are skipped rather than failing the batch.
+
+        Args:
+            container_name: Name of the container.
+            blob_names: Names of the blobs to delete.
+        """
+        container_client = self._get_container_client(container_name)
+        names = iter(blob_names)
+        while True:
+            batch = list(islice(names, 256))
+            if not batch:
+                break
+            container_client.delete_blobs(*batch, raise_on_any_failure=False)
+
     def delete_container(self, container_name: str) -> None:
         """
         Delete a container and all its blobs.
@@ -156,15 +585,83 @@ class AzureBlobStorage:
         """
         self.blob_service_client.delete_container(container_name)
 
-    def list_blobs(self, container_name: str) -> list:
+    def iter_blob_names(
+        self,
+        container_name: str,
+        name_starts_with: Optional[str] = None,
+        results_per_page: int = 5000
+    ) -> Iterator[str]:
+        """
+        Iterate blob names in a container lazily.
+
+        Uses the name-only listing so the service returns just blob
+        names instead of full per-blob properties XML, skipping the
+        deserialization of ETag/last-modified/tier/etc. for every entry.
+        A prefix filter is applied server-side, so narrowing the listing
+        also cuts response bytes and page count. Names are yielded as
+        pages arrive, so the first name is available after one round
+        trip and only one page is buffered at a time.
+
+        Args:
+            container_name: Name of the container.
+            name_starts_with: Only list blobs whose names start with this prefix.
+            results_per_page: Maximum number of names per listing page.
+
+        Returns:
+            Iterator of blob names.
+        """
+        container_client = self._get_container_client(container_name)
+        return container_client.list_blob_names(
+            name_starts_with=name_starts_with,
+            results_per_page=results_per_page
+        )
+
+    def list_blobs(
+        self,
+        container_name: str,
+        name_starts_with: Optional[str] = None,
+        results_per_page: int = 5000
+    ) -> list:
         """
-        List all blobs in a container.
+        List blobs in a container.
+
+        Materializes the full name list; prefer iter_blob_names() when
+        the caller can consume names incrementally.
 
         Args:
             container_name: Name of the container.
+            name_starts_with: Only list blobs whose names start with this prefix.
+            results_per_page: Maximum number of names per listing page.
 
         Returns:
             List of blob names.
         """
-        container_client = self.blob_service_client.get_container_client(container_name)
-        return [blob.name for blob in container_client.list_blobs()]
+        return list(self.iter_blob_names(
+            container_name,
+            name_starts_with=name_starts_with,
+            results_per_page=results_per_page
+        ))
+
+    def list_blob_hierarchy(
+        self,
+        container_name: str,
+        prefix: Optional[str] = None,
+        delimiter: str = '/'
+    ) -> Iterator:
+        """
+        Walk blobs one level of the pseudo-hierarchy at a time.
+
+        Yields blobs and BlobPrefix markers directly under the given
+        prefix, so directory-style navigation never traverses the whole
+        container namespace.
+
+        Args:
+            container_name: Name of the container.
+            prefix: Only walk blobs whose names start with this prefix.
+            delimiter: Character separating the pseudo-hierarchy levels.
+
+        Returns:
+            Iterator of BlobProperties and BlobPrefix items under the prefix.
+        """
+        container_client = self._get_container_client(container_name)
+        return container_client.walk_blobs(name_starts_with=prefix, delimiter=delimiter)
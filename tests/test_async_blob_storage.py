@@ -0,0 +1,89 @@
+"""
+Tests for the asynchronous Azure Blob Storage client.
+"""
+import asyncio
+import os
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+from storage.async_blob_storage import AsyncAzureBlobStorage
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+@pytest_asyncio.fixture
+async def blob_storage():
+    """Create an async blob storage client and close it after the test."""
+    connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+    if not connection_string:
+        pytest.skip("AZURE_STORAGE_CONNECTION_STRING not set")
+
+    storage = AsyncAzureBlobStorage(connection_string)
+    yield storage
+    await storage.close()
+
+
+@pytest.fixture
+def test_container_name():
+    """Return a unique test container name."""
+    import uuid
+    return f"test-container-{uuid.uuid4().hex[:8]}"
+
+
+@pytest_asyncio.fixture
+async def cleanup_container(blob_storage, test_container_name):
+    """Fixture to clean up test container after test."""
+    yield
+    # Cleanup after test
+    try:
+        await blob_storage.delete_container(test_container_name)
+    except Exception:
+        pass  # Container might not exist
+
+
+class TestAsyncAzureBlobStorage:
+    """Test suite for async Azure Blob Storage operations."""
+
+    @pytest.mark.asyncio
+    async def test_upload_and_download_blob(self, blob_storage, test_container_name, cleanup_container):
+        """Test uploading and downloading a blob asynchronously."""
+        await blob_storage.create_container(test_container_name)
+
+        blob_name = "test-file.txt"
+        test_data = "Hello, async Azure Blob Storage!"
+
+        blob_client = await blob_storage.upload_blob(test_container_name, blob_name, test_data)
+        assert blob_client is not None
+
+        downloaded_data = await blob_storage.get_blob_as_text(test_container_name, blob_name)
+        assert downloaded_data == test_data
+
+    @pytest.mark.asyncio
+    async def test_concurrent_uploads(self, blob_storage, test_container_name, cleanup_container):
+        """Test uploading multiple blobs concurrently with asyncio.gather."""
+        await blob_storage.create_container(test_container_name)
+
+        blob_names = ["file1.txt", "file2.txt", "file3.txt"]
+        await asyncio.gather(*[
+            blob_storage.upload_blob(test_container_name, name, f"Content of {name}")
+            for name in blob_names
+        ])
+
+        listed_blobs = await blob_storage.list_blobs(test_container_name)
+        assert set(listed_blobs) == set(blob_names)
+
+    @pytest.mark.asyncio
+    async def test_blob_exists(self, blob_storage, test_container_name, cleanup_container):
+        """Test checking if a blob exists asynchronously."""
+        await blob_storage.create_container(test_container_name)
+
+        blob_name = "exists-test.txt"
+        assert not await blob_storage.blob_exists(test_container_name, blob_name)
+
+        await blob_storage.upload_blob(test_container_name, blob_name, "test data")
+        assert await blob_storage.blob_exists(test_container_name, blob_name)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
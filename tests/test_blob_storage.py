@@ -11,14 +11,21 @@ from azure.core.exceptions import ResourceNotFoundError
 load_dotenv()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blob_storage():
-    """Create a blob storage client instance."""
+    """Create one blob storage client shared by the whole test session.
+
+    Session scope keeps a single warm connection pool across tests
+    instead of paying a TCP + TLS handshake per test; isolation comes
+    from the function-scoped unique container names.
+    """
     connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
     if not connection_string:
         pytest.skip("AZURE_STORAGE_CONNECTION_STRING not set")
 
-    return AzureBlobStorage(connection_string)
+    storage = AzureBlobStorage(connection_string)
+    yield storage
+    storage.close()
 
 
 @pytest.fixture
@@ -82,6 +89,21 @@ class TestAzureBlobStorage:
         downloaded_data = blob_storage.download_blob(test_container_name, blob_name)
         assert downloaded_data == test_data
 
+    def test_upload_bytearray_and_memoryview(self, blob_storage, test_container_name, cleanup_container):
+        """Test uploading bytearray and memoryview payloads."""
+        # Create container
+        blob_storage.create_container(test_container_name)
+
+        test_data = b"Binary data \x00\x01\x02\x03"
+
+        # Upload from a bytearray
+        blob_storage.upload_blob(test_container_name, "from-bytearray.bin", bytearray(test_data))
+        assert blob_storage.download_blob(test_container_name, "from-bytearray.bin") == test_data
+
+        # Upload from a memoryview
+        blob_storage.upload_blob(test_container_name, "from-memoryview.bin", memoryview(test_data))
+        assert blob_storage.download_blob(test_container_name, "from-memoryview.bin") == test_data
+
     def test_blob_exists(self, blob_storage, test_container_name, cleanup_container):
         """Test checking if a blob exists."""
         # Create container
@@ -119,10 +141,13 @@ class TestAzureBlobStorage:
         # Create container
         blob_storage.create_container(test_container_name)
 
-        # Upload multiple blobs
+        # Upload multiple blobs concurrently; each upload is independent,
+        # so there's no reason to serialize the round trips.
         blob_names = ["file1.txt", "file2.txt", "file3.txt"]
-        for blob_name in blob_names:
-            blob_storage.upload_blob(test_container_name, blob_name, f"Content of {blob_name}")
+        blob_storage.upload_many(
+            test_container_name,
+            [(blob_name, f"Content of {blob_name}") for blob_name in blob_names]
+        )
 
         # List blobs
         listed_blobs = blob_storage.list_blobs(test_container_name)
@@ -148,6 +173,145 @@ class TestAzureBlobStorage:
         blob_storage.upload_blob(test_container_name, blob_name, new_data, overwrite=True)
         assert blob_storage.get_blob_as_text(test_container_name, blob_name) == new_data
 
+    def test_compressed_upload_round_trip(self, blob_storage, test_container_name, cleanup_container):
+        """Test that a blob uploaded with compress=True reads back as text."""
+        # Create container
+        blob_storage.create_container(test_container_name)
+
+        blob_name = "compressed.txt"
+        test_data = "compressible line\n" * 1000
+
+        # Upload compressed
+        blob_storage.upload_blob(test_container_name, blob_name, test_data, compress=True)
+
+        # get_blob_as_text must decompress transparently
+        assert blob_storage.get_blob_as_text(test_container_name, blob_name) == test_data
+
+        # Raw download returns the stored gzip bytes verbatim
+        import gzip
+        raw = blob_storage.download_blob(test_container_name, blob_name)
+        assert gzip.decompress(raw).decode('utf-8') == test_data
+
+    def test_upload_if_missing(self, blob_storage, test_container_name, cleanup_container):
+        """Test create-only uploads via the if_missing precondition."""
+        # Create container
+        blob_storage.create_container(test_container_name)
+
+        blob_name = "if-missing-test.txt"
+
+        # First upload succeeds and returns a client
+        blob_client = blob_storage.upload_blob(
+            test_container_name, blob_name, "original", if_missing=True
+        )
+        assert blob_client is not None
+
+        # Second upload loses the precondition race and returns None,
+        # leaving the original content in place
+        assert blob_storage.upload_blob(
+            test_container_name, blob_name, "usurper", if_missing=True
+        ) is None
+        assert blob_storage.get_blob_as_text(test_container_name, blob_name) == "original"
+
+    def test_stream_blob(self, blob_storage, test_container_name, cleanup_container):
+        """Test downloading a blob as a chunk iterator."""
+        # Create container and upload blob
+        blob_storage.create_container(test_container_name)
+        blob_name = "stream-test.bin"
+        test_data = b"stream me" * 1000
+        blob_storage.upload_blob(test_container_name, blob_name, test_data)
+
+        # Reassembled chunks must equal the original payload
+        chunks = list(blob_storage.stream_blob(test_container_name, blob_name))
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert b"".join(chunks) == test_data
+
+    def test_download_blob_to_file(self, blob_storage, test_container_name, cleanup_container, tmp_path):
+        """Test downloading a blob straight into a local file."""
+        # Create container and upload blob
+        blob_storage.create_container(test_container_name)
+        blob_name = "to-file-test.bin"
+        test_data = b"save me to disk \x00\x01"
+        blob_storage.upload_blob(test_container_name, blob_name, test_data)
+
+        # Download to a file and verify contents
+        target = tmp_path / "downloaded.bin"
+        blob_storage.download_blob_to_file(test_container_name, blob_name, str(target))
+        assert target.read_bytes() == test_data
+
+    def test_try_download(self, blob_storage, test_container_name, cleanup_container):
+        """Test try_download for both existing and missing blobs."""
+        # Create container
+        blob_storage.create_container(test_container_name)
+
+        blob_name = "try-download-test.txt"
+
+        # Missing blob maps to None rather than raising
+        assert blob_storage.try_download(test_container_name, blob_name) is None
+
+        # Existing blob returns its content
+        blob_storage.upload_blob(test_container_name, blob_name, "present")
+        assert blob_storage.try_download(test_container_name, blob_name) == b"present"
+
+    def test_delete_blobs(self, blob_storage, test_container_name, cleanup_container):
+        """Test batch-deleting multiple blobs."""
+        # Create container and upload blobs
+        blob_storage.create_container(test_container_name)
+        blob_names = [f"batch-{i}.txt" for i in range(5)]
+        for blob_name in blob_names:
+            blob_storage.upload_blob(test_container_name, blob_name, "delete me")
+
+        # Delete them in one batch, plus a name that doesn't exist
+        blob_storage.delete_blobs(test_container_name, blob_names + ["never-existed.txt"])
+
+        # Container is empty afterwards
+        assert blob_storage.list_blobs(test_container_name) == []
+
+    def test_list_blobs_with_prefix(self, blob_storage, test_container_name, cleanup_container):
+        """Test server-side prefix filtering and lazy name iteration."""
+        # Create container and upload blobs under two prefixes
+        blob_storage.create_container(test_container_name)
+        for blob_name in ["logs/a.txt", "logs/b.txt", "data/c.txt"]:
+            blob_storage.upload_blob(test_container_name, blob_name, "x")
+
+        # Prefix filter narrows the listing
+        assert set(blob_storage.list_blobs(test_container_name, name_starts_with="logs/")) == \
+            {"logs/a.txt", "logs/b.txt"}
+
+        # iter_blob_names yields the same names lazily
+        names = blob_storage.iter_blob_names(test_container_name, name_starts_with="data/")
+        assert list(names) == ["data/c.txt"]
+
+    def test_list_blob_hierarchy(self, blob_storage, test_container_name, cleanup_container):
+        """Test walking one level of the pseudo-hierarchy."""
+        # Create container and upload blobs in a directory-style layout
+        blob_storage.create_container(test_container_name)
+        for blob_name in ["root.txt", "sub/nested.txt", "sub/deeper/leaf.txt"]:
+            blob_storage.upload_blob(test_container_name, blob_name, "x")
+
+        # The top level holds one blob and one prefix marker
+        items = list(blob_storage.list_blob_hierarchy(test_container_name))
+        names = {item.name for item in items}
+        assert names == {"root.txt", "sub/"}
+
+    def test_put_object_creates_missing_container(self, blob_storage, test_container_name, cleanup_container):
+        """Test that put_object creates the container on demand."""
+        blob_name = "auto-container.txt"
+        test_data = "created on demand"
+
+        # No create_container call: the container doesn't exist yet
+        blob_client = blob_storage.put_object(test_container_name, blob_name, test_data)
+        assert blob_client is not None
+        assert blob_storage.get_blob_as_text(test_container_name, blob_name) == test_data
+
+    def test_put_object_rejects_one_shot_iterators(self, blob_storage, test_container_name, cleanup_container):
+        """Test that put_object refuses payloads it cannot replay."""
+        chunks = (piece for piece in [b"part1", b"part2"])
+
+        # A generator would be consumed by a failed first attempt, so the
+        # container-creation retry would silently upload a truncated blob.
+        with pytest.raises(TypeError):
+            blob_storage.put_object(test_container_name, "generator.bin", chunks)
+
     def test_download_nonexistent_blob(self, blob_storage, test_container_name, cleanup_container):
         """Test downloading a blob that doesn't exist."""
         # Create container
@@ -159,19 +323,16 @@ class TestAzureBlobStorage:
 
     def test_basic_create_and_get_workflow(self, blob_storage, test_container_name, cleanup_container):
         """
-        Test basic workflow: Create container, upload blob, retrieve blob.
+        Test basic workflow: Upload blob (creating the container on
+        demand), then retrieve it.
         This is the main test for basic create and get operations.
         """
-        # Step 1: Create container
-        container_client = blob_storage.create_container(test_container_name)
-        assert container_client.container_name == test_container_name
-        print(f"✓ Container '{test_container_name}' created successfully")
-
-        # Step 2: Upload a blob
+        # Step 1: Upload a blob; put_object creates the container only
+        # if it's missing, so no separate create_container round trip.
         blob_name = "sample-data.txt"
         test_content = "This is a test file for Azure Blob Storage"
 
-        blob_client = blob_storage.upload_blob(
+        blob_client = blob_storage.put_object(
             container_name=test_container_name,
             blob_name=blob_name,
             data=test_content
@@ -179,16 +340,14 @@ class TestAzureBlobStorage:
         assert blob_client is not None
         print(f"✓ Blob '{blob_name}' uploaded successfully")
 
-        # Step 3: Verify blob exists
-        assert blob_storage.blob_exists(test_container_name, blob_name)
-        print(f"✓ Blob existence verified")
-
-        # Step 4: Download and verify content
-        downloaded_content = blob_storage.get_blob_as_text(test_container_name, blob_name)
-        assert downloaded_content == test_content
+        # Step 2: Download straight off the returned BlobClient — no
+        # existence check (we just uploaded it) and no fresh client
+        # lookup, so the warm keep-alive connection is reused.
+        downloaded = blob_client.download_blob().readall()
+        assert downloaded.decode('utf-8') == test_content
         print(f"✓ Blob content retrieved and verified successfully")
         print(f"  Original:   '{test_content}'")
-        print(f"  Downloaded: '{downloaded_content}'")
+        print(f"  Downloaded: '{downloaded.decode('utf-8')}'")
 
 
 if __name__ == "__main__":